@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import math
-import random
+import threading
+import time
 import tkinter as tk
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
-from logic import GameLogic, Vector2, Color, Ball, Rect
+import numpy as np
+
+from logic import BallArrays, GameLogic, Vector2, Rect, colors_from_hsv
 
 
 # ----------------------------
@@ -14,12 +17,148 @@ from logic import GameLogic, Vector2, Color, Ball, Rect
 WINDOW_WIDTH = 900
 WINDOW_HEIGHT = 600
 TARGET_FPS = 60
+PHYSICS_STEP = 1.0 / TARGET_FPS  # fixed simulation step (seconds)
+MAX_FRAME_DT = 0.05  # cap on wall time simulated per frame after a stall
 INITIAL_BALLS = 50  # start amount
+# "items": one canvas oval per ball; "framebuffer": balls are rasterized with
+# NumPy and blitted as a single image, which scales to thousands of balls
+RENDERER = "items"
+# "items" renderer: ovals are grouped into color buckets of this many bits per
+# channel and painted with their bucket's mean color (8 = exact colors)
+COLOR_BUCKET_BITS = 2
 
 # Deletion zone rectangle (in canvas/world coordinates)
 DELETION_ZONE = Rect(x=WINDOW_WIDTH - 180, y=40, width=140, height=90)
 
 
+class FrameBuffer:
+    """
+    Off-screen RGB raster blitted to the canvas as one image item.
+
+    Balls are stamped as precomputed antialiased circle sprites (one per
+    half-pixel radius) with NumPy slice blends, then the whole frame goes to
+    Tk in a single PPM upload. Two PhotoImages alternate so the visible one is
+    never rewritten while on screen.
+    """
+
+    def __init__(self, canvas: tk.Canvas, width: int, height: int) -> None:
+        self.canvas = canvas
+        self.width = width
+        self.height = height
+        self._pixels = np.empty((height, width, 3), dtype=np.uint8)
+        self._ppm_header = f"P6 {width} {height} 255\n".encode("ascii")
+        self._photos = [tk.PhotoImage(width=width, height=height) for _ in range(2)]
+        self._front = 0
+        self._image_id = canvas.create_image(0, 0, anchor="nw", image=self._photos[0])
+        canvas.tag_lower(self._image_id)
+        self._sprites: Dict[int, np.ndarray] = {}
+
+    def draw(self, balls: BallArrays) -> None:
+        fb = self._pixels
+        fb.fill(255)
+        h, w = self.height, self.width
+        levels = balls.colors.astype(np.uint16)
+        centers = np.rint(balls.positions).astype(np.int64)
+        for (cx, cy), r, color in zip(centers.tolist(), balls.radii.tolist(), levels):
+            alpha = self._sprite(r)
+            half = alpha.shape[0] // 2
+            x0, y0 = cx - half, cy - half
+            x1, y1 = x0 + alpha.shape[1], y0 + alpha.shape[0]
+            # Clip the sprite against the frame edges
+            sx0, sy0 = max(0, -x0), max(0, -y0)
+            sx1 = alpha.shape[1] - max(0, x1 - w)
+            sy1 = alpha.shape[0] - max(0, y1 - h)
+            if sx0 >= sx1 or sy0 >= sy1:
+                continue
+            a = alpha[sy0:sy1, sx0:sx1]
+            region = fb[y0 + sy0 : y0 + sy1, x0 + sx0 : x0 + sx1]
+            region[...] = (region * (255 - a) + color * a) // 255
+
+        back = 1 - self._front
+        self._photos[back].configure(data=self._ppm_header + fb.tobytes(), format="PPM")
+        self.canvas.itemconfigure(self._image_id, image=self._photos[back])
+        self._front = back
+
+    def _sprite(self, radius: float) -> np.ndarray:
+        """Coverage (0..255) of a circle with `radius`, shaped (size, size, 1)."""
+        key = int(round(radius * 2.0))
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            r = key / 2.0
+            half = int(math.ceil(r + 0.5))
+            yy, xx = np.mgrid[-half : half + 1, -half : half + 1]
+            coverage = np.clip(r + 0.5 - np.hypot(xx, yy), 0.0, 1.0)
+            sprite = np.rint(coverage * 255.0).astype(np.uint16)[:, :, None]
+            self._sprites[key] = sprite
+        return sprite
+
+
+class PhysicsWorker(threading.Thread):
+    """
+    Steps a `GameLogic` on a background thread.
+
+    The Tk thread reports elapsed wall time with `schedule_update`; the worker
+    advances the world in fixed `PHYSICS_STEP` increments while holding `lock`,
+    then publishes detached copies of the ball columns as the front frame. The
+    compiled kernels release the GIL, so stepping overlaps with Tk drawing.
+    Anything else that touches the world (suck / spit) must hold `lock`.
+    Call `stop` before tearing down the interpreter.
+    """
+
+    def __init__(self, logic: GameLogic) -> None:
+        super().__init__(name="physics", daemon=True)
+        self.logic = logic
+        self.lock = threading.Lock()
+        self._wake = threading.Condition()
+        self._pending = 0.0
+        self._accumulator = 0.0
+        self._stopping = False
+        self._front_lock = threading.Lock()
+        self._front = self._capture()
+
+    def schedule_update(self, dt: float) -> None:
+        with self._wake:
+            # A worker that fell behind drops time instead of spiraling
+            self._pending = min(self._pending + dt, MAX_FRAME_DT)
+            self._wake.notify()
+
+    def stop(self) -> None:
+        """Ask the worker to exit after its current step and wait for it."""
+        with self._wake:
+            self._stopping = True
+            self._wake.notify()
+        if self.is_alive():
+            self.join()
+
+    def front(self) -> Tuple[BallArrays, int]:
+        """Latest published (balls, inventory size); never written after publication."""
+        with self._front_lock:
+            return self._front
+
+    def run(self) -> None:
+        while True:
+            with self._wake:
+                while self._pending <= 0.0 and not self._stopping:
+                    self._wake.wait()
+                if self._stopping:
+                    return
+                self._accumulator += self._pending
+                self._pending = 0.0
+
+            with self.lock:
+                # Fixed steps so contacts behave the same at any frame rate
+                while self._accumulator >= PHYSICS_STEP:
+                    self.logic.update(PHYSICS_STEP)
+                    self._accumulator -= PHYSICS_STEP
+                frame = self._capture()
+
+            with self._front_lock:
+                self._front = frame
+
+    def _capture(self) -> Tuple[BallArrays, int]:
+        return self.logic.ball_arrays().copy(), len(self.logic.inventory)
+
+
 class BallGameApp:
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
@@ -46,31 +185,48 @@ class BallGameApp:
         self.canvas.bind("<ButtonRelease-1>", self._on_mouse_up_left)
         self.canvas.bind("<ButtonPress-3>", self._on_mouse_down_right)
 
-        # Animation
-        self._last_time_ms: Optional[int] = None
+        # Persistent canvas items: ovals are keyed by ball id and moved every frame
+        self._framebuffer: Optional[FrameBuffer] = None
+        if RENDERER == "framebuffer":
+            self._framebuffer = FrameBuffer(self.canvas, WINDOW_WIDTH, WINDOW_HEIGHT)
+        self._oval_ids: Dict[int, int] = {}
+        self._oval_buckets: Dict[int, int] = {}
+        self._bucket_fills: Dict[int, str] = {}
+        self._draw_deletion_zone()
+        self._hud_inventory: Optional[int] = None
+        self._hud_id = self.canvas.create_text(
+            10, 10, anchor="nw", text="", fill="#333", font=("Arial", 12), tags="overlay"
+        )
+        self._cursor_visible = False
+        self._cursor_id = self.canvas.create_oval(0, 0, 0, 0, outline="#888", dash=(3, 3), state="hidden", tags="overlay")
+
+        # Animation: physics runs on the worker, Tk only draws its front frame
+        self.physics = PhysicsWorker(self.logic)
+        self.physics.start()
+        root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._last_t = time.perf_counter()
         self._tick()
 
     # ----------------------------
     # Setup helpers
     # ----------------------------
     def _spawn_initial_balls(self, count: int) -> None:
-        rng = random.Random(7)
-        for _ in range(count):
-            x = rng.uniform(30, WINDOW_WIDTH - 30)
-            y = rng.uniform(30, WINDOW_HEIGHT - 30)
-            speed = rng.uniform(30, 120)
-            angle = rng.uniform(0, 2 * math.pi)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            radius = rng.uniform(7, 14)
-
-            # rainbow-ish palette
-            h = rng.random()
-            s = 0.7 + 0.3 * rng.random()
-            v = 0.8 + 0.2 * rng.random()
-            color = Color.from_hsv(h, s, v)
-
-            self.logic.create_ball(Vector2(x, y), Vector2(vx, vy), radius, color)
+        rng = np.random.default_rng(7)
+        positions = np.column_stack(
+            (rng.uniform(30, WINDOW_WIDTH - 30, size=count), rng.uniform(30, WINDOW_HEIGHT - 30, size=count))
+        )
+        speeds = rng.uniform(30, 120, size=count)
+        angles = rng.uniform(0, 2 * math.pi, size=count)
+        velocities = np.column_stack((np.cos(angles) * speeds, np.sin(angles) * speeds))
+        radii = rng.uniform(7, 14, size=count)
+
+        # rainbow-ish palette
+        h = rng.random(count)
+        s = 0.7 + 0.3 * rng.random(count)
+        v = 0.8 + 0.2 * rng.random(count)
+        colors = colors_from_hsv(h, s, v)
+
+        self.logic.create_balls(positions, velocities, radii, colors)
 
     # ----------------------------
     # Event handlers
@@ -98,53 +254,110 @@ class BallGameApp:
             dy = event.y - self.mouse_pos[1]
             if abs(dx) + abs(dy) > 0.01:
                 direction = Vector2(dx, dy)
-        self.logic.spit_from_inventory(point, direction, count=3)
+        with self.physics.lock:
+            self.logic.spit_from_inventory(point, direction, count=3)
 
     # ----------------------------
     # Animation and rendering
     # ----------------------------
     def _tick(self) -> None:
-        now = self.root.winfo_fpixels("1i")  # placeholder to ensure Tk is initialized
-        # Use Tk's timer for dt
-        cur_ms = self.root.winfo_pointerx()  # not ideal; we will fall back to fixed dt
-        dt = 1.0 / TARGET_FPS
+        now = time.perf_counter()
+        elapsed = now - self._last_t
+        self._last_t = now
 
         # Suck behavior when holding left mouse
         if self.is_sucking and self.mouse_pos is not None:
             suck_point = Vector2(self.mouse_pos[0], self.mouse_pos[1])
-            self.logic.suck_into_inventory(suck_point, radius=60.0, max_count=4)
+            with self.physics.lock:
+                self.logic.suck_into_inventory(suck_point, radius=60.0, max_count=4)
 
-        # Update world
-        self.logic.update(dt)
+        # Let the worker advance the world while we draw its last frame
+        self.physics.schedule_update(elapsed)
 
         # Redraw
         self._render()
 
         # Schedule next frame
-        self.root.after(int(1000 / TARGET_FPS), self._tick)
+        self._tick_job = self.root.after(int(1000 / TARGET_FPS), self._tick)
+
+    def _on_close(self) -> None:
+        # Let the worker leave its compiled kernels before the interpreter goes away
+        self.root.after_cancel(self._tick_job)
+        self.physics.stop()
+        self.root.destroy()
 
     def _render(self) -> None:
-        self.canvas.delete("all")
-        self._draw_deletion_zone()
-        balls = self.logic.list_balls()
-        for b in balls:
-            self._draw_ball(b)
+        balls, inv = self.physics.front()
+        if self._framebuffer is not None:
+            self._framebuffer.draw(balls)
+        else:
+            self._render_ovals(balls)
+
         # Inventory count HUD
-        inv = len(self.logic.inventory)
-        self.canvas.create_text(10, 10, anchor="nw", text=f"Inventory: {inv}", fill="#333", font=("Arial", 12))
+        if inv != self._hud_inventory:
+            self.canvas.itemconfigure(self._hud_id, text=f"Inventory: {inv}")
+            self._hud_inventory = inv
 
         # Cursor visual if sucking
         if self.is_sucking and self.mouse_pos is not None:
             x, y = self.mouse_pos
             r = 60
-            self.canvas.create_oval(x - r, y - r, x + r, y + r, outline="#888", dash=(3, 3))
+            self.canvas.coords(self._cursor_id, x - r, y - r, x + r, y + r)
+            if not self._cursor_visible:
+                self.canvas.itemconfigure(self._cursor_id, state="normal")
+                self._cursor_visible = True
+        elif self._cursor_visible:
+            self.canvas.itemconfigure(self._cursor_id, state="hidden")
+            self._cursor_visible = False
+
+    def _render_ovals(self, balls: BallArrays) -> None:
+        ids = balls.ids.tolist()
+        keys, fills = self._color_buckets(balls.colors)
+
+        # Every oval carries its bucket's tag: one fill per bucket whose color moved
+        for key, fill in fills.items():
+            if self._bucket_fills.get(key) != fill:
+                self.canvas.itemconfigure(f"c{key}", fill=fill)
+                self._bucket_fills[key] = fill
+
+        created = False
+        for bid, (x, y), r, key in zip(ids, balls.positions.tolist(), balls.radii.tolist(), keys.tolist()):
+            oid = self._oval_ids.get(bid)
+            if oid is None:
+                self._oval_ids[bid] = self.canvas.create_oval(
+                    x - r, y - r, x + r, y + r, fill=fills[key], outline="", tags=f"c{key}"
+                )
+                self._oval_buckets[bid] = key
+                created = True
+                continue
+            self.canvas.coords(oid, x - r, y - r, x + r, y + r)
+            # Per-item configuration only when a ball changes bucket
+            if key != self._oval_buckets[bid]:
+                self.canvas.itemconfigure(oid, fill=fills[key], tags=f"c{key}")
+                self._oval_buckets[bid] = key
+
+        # Drop ovals of balls that left the world (deleted or sucked up)
+        if len(self._oval_ids) > len(ids):
+            alive = set(ids)
+            for bid in [bid for bid in self._oval_ids if bid not in alive]:
+                self.canvas.delete(self._oval_ids.pop(bid))
+                del self._oval_buckets[bid]
+
+        # Keep HUD and cursor above freshly created balls
+        if created:
+            self.canvas.tag_raise("overlay")
 
-    def _draw_ball(self, ball: Ball) -> None:
-        x = ball.position.x
-        y = ball.position.y
-        r = ball.radius
-        fill = self._color_to_hex(ball.color)
-        self.canvas.create_oval(x - r, y - r, x + r, y + r, fill=fill, outline="")
+    @staticmethod
+    def _color_buckets(colors: np.ndarray) -> Tuple[np.ndarray, Dict[int, str]]:
+        """Bucket key per ball, and the hex mean color of every non-empty bucket."""
+        bits = COLOR_BUCKET_BITS
+        q = (colors >> (8 - bits)).astype(np.int64)
+        keys = (q[:, 0] << (2 * bits)) | (q[:, 1] << bits) | q[:, 2]
+        present, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+        sums = np.column_stack([np.bincount(inverse, weights=colors[:, c], minlength=len(present)) for c in range(3)])
+        means = np.rint(sums / counts[:, None]).astype(np.int64)
+        fills = {key: f"#{r:02x}{g:02x}{b:02x}" for key, (r, g, b) in zip(present.tolist(), means.tolist())}
+        return keys, fills
 
     def _draw_deletion_zone(self) -> None:
         dz = self.logic.deletion_zone
@@ -157,13 +370,6 @@ class BallGameApp:
         self.canvas.create_rectangle(x0, y0, x1, y1, outline="#d33", width=2)
         self.canvas.create_text((x0 + x1) / 2, y0 + 14, text="Delete Zone", fill="#d33", font=("Arial", 12, "bold"))
 
-    @staticmethod
-    def _color_to_hex(c: Color) -> str:
-        r = int(max(0, min(255, round(c.r * 255))))
-        g = int(max(0, min(255, round(c.g * 255))))
-        b = int(max(0, min(255, round(c.b * 255))))
-        return f"#{r:02x}{g:02x}{b:02x}"
-
 
 def main() -> None:
     root = tk.Tk()
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from logic import _HAVE_NUMBA, GameLogic, Rect, Vector2, _integrate, colors_from_hsv
+
+
+def _world(n: int, seed: int, *, width: float = 900.0, height: float = 600.0, max_speed: float = 120.0) -> GameLogic:
+    rng = np.random.default_rng(seed)
+    logic = GameLogic(width, height, random_seed=seed)
+    angles = rng.uniform(0.0, 2.0 * np.pi, size=n)
+    speeds = rng.uniform(30.0, max_speed, size=n)
+    logic.create_balls(
+        rng.uniform((0.0, 0.0), (width, height), size=(n, 2)),
+        np.column_stack((np.cos(angles) * speeds, np.sin(angles) * speeds)),
+        rng.uniform(7.0, 14.0, size=n),
+        colors_from_hsv(rng.random(n), rng.random(n), rng.random(n)),
+    )
+    return logic
+
+
+def _churn(logic: GameLogic, rng: np.random.Generator) -> None:
+    """Random suck / spit / remove, the structural changes the GUI makes."""
+    point = Vector2(rng.uniform(0.0, logic.width), rng.uniform(0.0, logic.height))
+    roll = rng.random()
+    if roll < 0.3:
+        logic.suck_into_inventory(point, radius=60.0, max_count=int(rng.integers(1, 6)))
+    elif roll < 0.6:
+        direction = None if rng.random() < 0.5 else Vector2(rng.normal(), rng.normal())
+        logic.spit_from_inventory(point, direction, count=int(rng.integers(1, 6)))
+    elif roll < 0.7 and logic.ball_count:
+        logic.remove_ball(int(logic.ball_arrays().ids[rng.integers(logic.ball_count)]))
+
+
+def _touching_pairs(logic: GameLogic) -> set:
+    balls = logic.ball_arrays()
+    a, b = np.triu_indices(logic.ball_count, 1)
+    d = balls.positions[b] - balls.positions[a]
+    reach = balls.radii[a] + balls.radii[b]
+    touching = np.einsum("ij,ij->i", d, d) <= reach * reach
+    return set(zip(a[touching].tolist(), b[touching].tolist()))
+
+
+@pytest.mark.parametrize(
+    "n, width, height, max_speed",
+    [
+        (60, 900.0, 600.0, 120.0),  # all-pairs candidates
+        (600, 900.0, 600.0, 120.0),  # grid candidates
+        (400, 300.0, 200.0, 400.0),  # crowded, fast: many edge wraps per frame
+    ],
+)
+def test_neighbor_pairs_cover_every_contact(n: int, width: float, height: float, max_speed: float) -> None:
+    logic = _world(n, seed=n, width=width, height=height, max_speed=max_speed)
+    rng = np.random.default_rng(1)
+    for _ in range(300):
+        logic.update(1.0 / 60.0)
+        pair_a, pair_b = logic._neighbor_pairs()
+        pairs = list(zip(np.minimum(pair_a, pair_b).tolist(), np.maximum(pair_a, pair_b).tolist()))
+        assert len(pairs) == len(set(pairs))
+        assert _touching_pairs(logic) <= set(pairs)
+        _churn(logic, rng)
+
+
+def test_storage_stays_consistent_under_removal() -> None:
+    logic = _world(400, seed=12)
+    logic.set_deletion_zone(Rect(300.0, 200.0, 200.0, 150.0))
+    rng = np.random.default_rng(2)
+    for _ in range(300):
+        logic.update(1.0 / 60.0)
+        _churn(logic, rng)
+        balls = logic.ball_arrays()
+        ids = balls.ids.tolist()
+        assert len(set(ids)) == len(ids) == len(logic._slots)
+        assert all(logic._slots[bid] == row for row, bid in enumerate(ids))
+        assert logic._radius_sum == pytest.approx(balls.radii.sum())
+    # The zone really did compact the world along the way
+    assert logic.ball_count + len(logic.inventory) < 400
+
+
+def test_no_deletion_zone_keeps_every_ball() -> None:
+    logic = _world(300, seed=18, max_speed=400.0)
+    for _ in range(120):
+        logic.update(1.0 / 60.0)
+    assert logic.ball_count == 300
+
+
+@pytest.mark.skipif(not _HAVE_NUMBA, reason="needs Numba")
+def test_int_zone_reuses_the_warmed_up_kernel() -> None:
+    # Same int-valued zone as the GUI; a second signature would compile mid-game
+    logic = _world(100, seed=18)
+    logic.set_deletion_zone(Rect(x=720, y=40, width=140, height=90))
+    logic.update(1.0 / 60.0)
+    logic.update(1)
+    assert len(_integrate.signatures) == 1
+
+
+def test_create_balls_rejects_mismatched_columns() -> None:
+    logic = _world(5, seed=20)
+    with pytest.raises(ValueError):
+        logic.create_balls(np.zeros((3, 2)), np.zeros((3, 2)), np.ones(2), np.zeros((3, 3)))
+    assert logic.ball_count == 5
+    ids = logic.create_balls(np.zeros((1, 2)), np.zeros((1, 2)), np.ones(1), np.zeros((1, 3)))
+    assert ids.tolist() == [6]
+
+
+def test_balls_view_is_detached_and_matches_snapshot() -> None:
+    logic = _world(50, seed=23)
+    view = logic.balls_view()
+    snap = logic.snapshot()["balls"]
+    logic.update(1.0 / 60.0)
+    logic.remove_ball(snap[0]["id"])
+    balls = list(view)
+    assert [b.ball_id for b in balls] == [d["id"] for d in snap]
+    assert [(b.position.x, b.color.g) for b in balls] == [(d["x"], d["color"]["g"]) for d in snap]
+    assert len(logic.list_balls()) == 49